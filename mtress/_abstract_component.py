@@ -1,14 +1,17 @@
 """Abstract MTRESS components."""
 
 from __future__ import annotations
+import sys
 from abc import abstractmethod
+from contextlib import contextmanager
 
-from typing import TYPE_CHECKING, Callable, NamedTuple, Tuple
+from typing import TYPE_CHECKING, Callable, Iterable, NamedTuple, Tuple
 
 from graphviz import Digraph
-from oemof.solph import Bus
+from oemof.solph import Bus, Flow
 from oemof.solph.components import Source, Sink, Converter, GenericStorage
 
+from ._data_handler import TimeseriesSpecifier
 from ._interfaces import NamedElement
 from ._solph_model import SolphModel
 
@@ -72,7 +75,12 @@ class AbstractSolphRepresentation(AbstractComponent):
         super().__init__(**kwargs)
 
         self._solph_nodes: list = []
+        self._solph_labels: set = set()
         self._solph_model: SolphModel = None
+        # Nodes waiting to be added to the energy system, see collect_solph_nodes
+        self._pending_solph_nodes: list = None
+        # Location and component part of the solph labels, see _new_solph_node
+        self._solph_label_prefix: tuple = None
 
     def register_solph_model(self, solph_model: SolphModel) -> None:
         """Store a reference to the solph model."""
@@ -82,23 +90,137 @@ class AbstractSolphRepresentation(AbstractComponent):
         self._solph_model = solph_model
 
     def create_solph_node(self, label: str, node_type: Callable, **kwargs):
-        """Create a solph node and add it to the solph model."""
-        _full_label = SolphLabel(*self.create_label(label))
+        """
+        Create a solph node and add it to the solph model.
+
+        Note that a `Flow` is an edge in oemof.solph and stores its
+        input and output node, so every connection needs its own
+        `Flow` instance. Do not share (default) flows between nodes.
+        """
+        (_node,) = self.create_solph_nodes([(label, node_type, kwargs)])
+
+        return _node
+
+    def create_solph_nodes(
+        self, nodes: Iterable[tuple[str, Callable, dict]]
+    ) -> list:
+        """
+        Create several solph nodes and add them to the solph model at once.
+
+        The nodes cannot refer to each other on creation, connect them
+        afterwards if needed. If any label is already taken, no node is
+        created at all.
+
+        :param nodes: Tuples of (label, node_type, kwargs) as they would be
+            passed to `create_solph_node`
+        :return: List of the created nodes in the given order
+        """
+        nodes = list(nodes)
+        full_labels = [self._new_solph_label(label) for label, _, _ in nodes]
+        if len(set(full_labels)) < len(full_labels):
+            duplicate = next(
+                label for label in full_labels if full_labels.count(label) > 1
+            )
+            raise KeyError(f"Solph component named {duplicate} already exists")
+
+        _nodes = [
+            self._new_solph_node(full_label, node_type, kwargs)
+            for full_label, (_, node_type, kwargs) in zip(full_labels, nodes)
+        ]
+
+        # Only register the nodes once all of them have been created
+        self._solph_nodes.extend(_nodes)
+        self._solph_labels.update(label.solph_node for label in full_labels)
+        self._add_to_energy_system(_nodes)
+
+        return _nodes
+
+    @contextmanager
+    def collect_solph_nodes(self):
+        """
+        Collect nodes created within the context and add them at once.
 
-        if label in self._solph_nodes:
+        Nodes are only added to the energy system when the context is left
+        without an error.
+        """
+        self._pending_solph_nodes = []
+        try:
+            yield
+        finally:
+            _nodes, self._pending_solph_nodes = self._pending_solph_nodes, None
+
+        self._solph_model.energy_system.add(*_nodes)
+
+    def _add_to_energy_system(self, nodes: list):
+        """Add nodes to the energy system or defer them if collecting."""
+        if self._pending_solph_nodes is not None:
+            self._pending_solph_nodes.extend(nodes)
+        else:
+            self._solph_model.energy_system.add(*nodes)
+
+    def _new_solph_label(self, label: str) -> SolphLabel:
+        """Create the full label of a new solph node of this component."""
+        if self._solph_label_prefix is None:
+            # The identifier is the same for all nodes of this component
+            self._solph_label_prefix = tuple(map(sys.intern, self.identifier))
+
+        # Labels are often formatted at runtime, interning them makes
+        # equal labels share a single string object (and its cached hash)
+        label = sys.intern(label)
+        _full_label = SolphLabel(*self._solph_label_prefix, label)
+
+        if label in self._solph_labels:
             raise KeyError(f"Solph component named {_full_label} already exists")
 
-        _node = node_type(label=_full_label, **kwargs)
+        return _full_label
+
+    def _new_solph_node(
+        self, full_label: SolphLabel, node_type: Callable, kwargs: dict
+    ):
+        """Create a solph node referring to this component."""
+        _node = node_type(label=full_label, **kwargs)
 
         # Store a reference to the MTRESS component
         setattr(_node, "mtress_component", self)
-        setattr(_node, "short_label", label)
-
-        self._solph_nodes.append(_node)
-        self._solph_model.energy_system.add(_node)
+        setattr(_node, "short_label", full_label.solph_node)
 
         return _node
 
+    def _create_sink_with_bus(
+        self,
+        upstream_node,
+        time_series: TimeseriesSpecifier,
+        bus_label: str = "input",
+    ):
+        """
+        Create a bus feeding a sink with a fixed (demand) time series.
+
+        :param upstream_node: Node supplying the bus, None to connect it later
+        :param time_series: Time series specifier of the sink
+        :param bus_label: Label of the bus
+        :return: The created bus
+        """
+        bus = self.create_solph_node(
+            label=bus_label,
+            node_type=Bus,
+            inputs=None if upstream_node is None else {upstream_node: Flow()},
+        )
+
+        self.create_solph_node(
+            label="sink",
+            node_type=Sink,
+            inputs={
+                bus: Flow(
+                    nominal_value=1,
+                    fix=self._solph_model.data.get_interval_timeseries(
+                        time_series
+                    ),
+                )
+            },
+        )
+
+        return bus
+
     @property
     def solph_nodes(self) -> list:
         """Iterate over solph nodes."""
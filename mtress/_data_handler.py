@@ -4,8 +4,30 @@ from enum import IntEnum
 
 import numpy as np
 import pandas as pd
+from numpy.typing import NDArray
+
+TimeseriesSpecifier = str | pd.Series | list | float | NDArray[np.float64]
+
+
+def normalize_timeseries_specifier(
+    specifier: TimeseriesSpecifier,
+) -> str | pd.Series | float | NDArray[np.float64]:
+    """
+    Convert sequences of values to a float array, keep other specifiers.
+
+    This is meant to be called once when a component is created, so the
+    values are not converted again whenever a model is built. Arrays that
+    already are contiguous float arrays are kept as they are.
+    """
+    if isinstance(specifier, list | tuple | np.ndarray):
+        values = np.ascontiguousarray(specifier, dtype=np.float64)
+        if values.ndim != 1:
+            raise ValueError("Time series values must be one-dimensional")
+
+        return values
+
+    return specifier
 
-TimeseriesSpecifier = str | pd.Series | list | float
 
 class TimeseriesType(IntEnum):
     POINT = 0
@@ -18,7 +40,23 @@ class DataHandler:
     def __init__(self, timeindex: pd.DatetimeIndex):
         """Initialize data handler."""
         self.timeindex = timeindex
+        # Target indices by kind, interval values have no value at the end
+        self._target_index = {
+            TimeseriesType.POINT: timeindex,
+            TimeseriesType.INTERVAL: timeindex[:-1],
+        }
         self._cache: dict[pd.DataFrame] = {}
+        # Resolved time series for hashable specifiers, keyed by (specifier, kind)
+        self._timeseries_cache: dict[tuple, pd.Series] = {}
+        # Resolved time series for arrays and series, keyed by (id, kind). The
+        # specifier is stored along with the result, so its id cannot be reused.
+        self._object_cache: dict[tuple, tuple[object, pd.Series]] = {}
+
+    def invalidate(self):
+        """Drop all cached data, e.g. after files have been changed."""
+        self._cache.clear()
+        self._timeseries_cache.clear()
+        self._object_cache.clear()
 
     def get_timeseries(
             self,
@@ -30,11 +68,40 @@ class DataHandler:
 
         This method takes a time series specifier and reads a
         time series from a file or checks a provided series for completeness.
+        Results are cached, so repeated requests, e.g. from demands sharing
+        one profile, do not read or align the data again. Note that solph
+        copies the values into every flow, the cache does not make flows
+        share their data. Arrays and series are identified by identity and
+        must not be changed in place.
         """
-        if kind == TimeseriesType.INTERVAL:
-            target_index = self.timeindex[:-1]
-        else:
-            target_index = self.timeindex
+        if isinstance(specifier, str | float | int):
+            key = (specifier, kind)
+            if key not in self._timeseries_cache:
+                self._timeseries_cache[key] = self._get_timeseries(specifier, kind)
+
+            return self._timeseries_cache[key]
+
+        if isinstance(specifier, np.ndarray | pd.Series):
+            key = (id(specifier), kind)
+            if key not in self._object_cache:
+                series = self._get_timeseries(specifier, kind)
+                self._object_cache[key] = (specifier, series)
+
+            return self._object_cache[key][1]
+
+        return self._get_timeseries(specifier, kind)
+
+    def get_interval_timeseries(self, specifier: TimeseriesSpecifier):
+        """Prepare a time series of interval values, see `get_timeseries`."""
+        return self.get_timeseries(specifier, TimeseriesType.INTERVAL)
+
+    def _get_timeseries(
+            self,
+            specifier: TimeseriesSpecifier,
+            kind: TimeseriesType
+        ):
+        """Prepare a time series without using the cache."""
+        target_index = self._target_index[kind]
 
         match specifier:
             case str() if specifier.startswith("FILE:"):
@@ -42,10 +109,14 @@ class DataHandler:
                 series = self._read_from_file(file, column)
 
                 # Call function again to check series for consistency
-                return self.get_timeseries(series, kind=kind)
+                return self._get_timeseries(series, kind=kind)
 
             case pd.Series() as series:
                 if isinstance(series.index, pd.DatetimeIndex):
+                    if series.index.equals(target_index):
+                        # Nothing to select, avoid copying the data
+                        return series
+
                     matching_index = target_index.isin(series.index)
                     if not matching_index.all():
                         raise KeyError(
@@ -97,7 +97,8 @@ def read_input_data(data_specifier: str) -> pd.Series:
     filepath, specifier = data_specifier.split(":", maxsplit=1)
 
     file = Path(filepath)
-    assert file.exists(), f"File {filepath} does not exist"
+    if not file.exists():
+        raise FileNotFoundError(f"File {filepath} does not exist")
 
     _suffix = file.suffix.lower()
     if _suffix not in _data_parsers:
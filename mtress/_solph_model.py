@@ -22,7 +22,7 @@ if TYPE_CHECKING:
     from ._abstract_component import AbstractSolphRepresentation
     from ._meta_model import MetaModel
 
-LOGGER = logging.getLogger(__file__)
+LOGGER = logging.getLogger(__name__)
 
 
 class SolphModel:
@@ -72,7 +72,9 @@ class SolphModel:
     def _build_solph_energy_system(self):
         """Build the `oemof.solph` representation of the energy system."""
         for component in self._meta_model.components:
-            component.build_core()
+            # Nodes of a component are added to the energy system at once
+            with component.collect_solph_nodes():
+                component.build_core()
 
         for component in self._meta_model.components:
             component.establish_interconnections()
@@ -1,7 +1,7 @@
 """Abstract carrier class to ensure a unified interface."""
 
-
-import numpy as np
+from bisect import bisect_left
+from math import inf
 
 from .._abstract_component import AbstractComponent
 
@@ -37,8 +37,17 @@ class AbstractLayeredCarrier(AbstractCarrier):
         self._levels = levels
         self._reference = reference
 
+        # Cache of results of get_surrounding_levels
+        self._surrounding_levels = {}
+
     def get_surrounding_levels(self, level):
-        return self._get_surrounding_levels(level, self._levels)
+        """Get the next bigger and smaller level."""
+        if level not in self._surrounding_levels:
+            self._surrounding_levels[level] = self._get_surrounding_levels(
+                level, self._levels
+            )
+
+        return self._surrounding_levels[level]
 
     @staticmethod
     def _get_surrounding_levels(level, levels):
@@ -46,10 +55,11 @@ class AbstractLayeredCarrier(AbstractCarrier):
         if level in levels:
             return level, level
 
-        # Extend levels by positive and negative infinity to prevent index errors
-        levels = np.concatenate(([np.NINF], levels, [np.PINF]))
-        i = np.searchsorted(levels, level)
-        return levels[i - 1], levels[i]
+        # Levels are sorted, beyond the outermost levels infinity is returned
+        i = bisect_left(levels, level)
+        lower = levels[i - 1] if i > 0 else -inf
+        upper = levels[i] if i < len(levels) else inf
+        return lower, upper
 
     @property
     def levels(self):
@@ -22,16 +22,23 @@ class GasCarrier(AbstractLayeredCarrier, AbstractSolphRepresentation):
 
     def __init__(self, *, gases, **kwargs):
         """Initialize carrier."""
-        referennce = {gas: 0 for gas in gases}
-        super().__init__(levels=gases, reference=referennce, **kwargs)
+        super().__init__(
+            levels=gases,
+            reference=dict.fromkeys(gases, 0),
+            **kwargs,
+        )
 
         self.distribution = {}
 
     def get_surrounding_levels(self, gas, pressure_level):
         """Get the next bigger and smaller level for the specified gas."""
-        return AbstractLayeredCarrier._get_surrounding_levels(
-            pressure_level, self._levels[gas]
-        )
+        key = (gas, pressure_level)
+        if key not in self._surrounding_levels:
+            self._surrounding_levels[key] = self._get_surrounding_levels(
+                pressure_level, self._levels[gas]
+            )
+
+        return self._surrounding_levels[key]
 
     @property
     def pressure_levels(self):
@@ -40,26 +47,25 @@ class GasCarrier(AbstractLayeredCarrier, AbstractSolphRepresentation):
 
     def build_core(self):
         """Build core structure of oemof.solph representation."""
+        buses = self.create_solph_nodes(
+            (f"{gas.name}_out_{pressure}", Bus, {})
+            for gas, pressures in self.levels.items()
+            for pressure in pressures
+        )
+
+        buses = iter(buses)
         for gas, pressures in self.levels.items():
-            pressure_low = None
             self.distribution[gas] = {}
+            bus_low = None
             for pressure in pressures:
-                # Check if this is the first bus for this gas
-                if not self.distribution[gas]:
-                    bus = self.create_solph_node(
-                        label=f"{gas.name}_out_{pressure}",
-                        node_type=Bus,
-                    )
-                else:
-                    bus = self.create_solph_node(
-                        label=f"{gas.name}_out_{pressure}",
-                        node_type=Bus,
-                        outputs={self.distribution[gas][pressure_low]: Flow()},
-                    )
+                bus = next(buses)
+                # Connect to the bus of the previous (lower) pressure level
+                if bus_low is not None:
+                    bus.outputs[bus_low] = Flow()
                 self.distribution[gas][pressure] = bus
 
                 # prepare for the next iteration of the loop
-                pressure_low = pressure
+                bus_low = bus
 
     @property
     def inputs(self):
@@ -11,6 +11,10 @@ SPDX-FileCopyrightText: Lucas Schmeling
 SPDX-License-Identifier: MIT
 """
 
+import sys
+from bisect import bisect_left
+
+import numpy as np
 from oemof.solph import Bus, Flow
 from oemof.solph.components import Converter
 
@@ -18,6 +22,25 @@ from .._abstract_component import AbstractSolphRepresentation
 from ._abstract_carrier import AbstractLayeredCarrier
 
 
+def _riser_ratios(levels, reference, reference_index):
+    """
+    Calculate the conversion ratios of risers between adjacent levels.
+
+    The ratio relates the temperature difference to the reference of the
+    level closer to the reference to the one of the level further away.
+    Entries for the pairs next to the reference are zero.
+
+    :param levels: Sorted temperature levels including the reference
+    :param reference: Reference temperature
+    :param reference_index: Index of the reference in the levels
+    """
+    deltas = np.asarray(levels, dtype=np.float64) - reference
+    above = np.arange(len(deltas) - 1) >= reference_index
+    return np.where(above, deltas[:-1], deltas[1:]) / np.where(
+        above, deltas[1:], deltas[:-1]
+    )
+
+
 class Heat(AbstractLayeredCarrier, AbstractSolphRepresentation):
     """
     Connector class for modelling power flows with variable temperature levels.
@@ -76,6 +99,10 @@ class Heat(AbstractLayeredCarrier, AbstractSolphRepresentation):
                                              reference_temperature=20))
     """
 
+    # Plans of the layer structure, keyed by (levels, reference). They only
+    # contain plain data and are shared by all carriers with the same levels.
+    _plan_cache: dict[tuple, tuple] = {}
+
     def __init__(
         self,
         temperature_levels: list[float],
@@ -87,56 +114,163 @@ class Heat(AbstractLayeredCarrier, AbstractSolphRepresentation):
         :param temperature_levels: Temperature levels (in °C)
         :param reference_temperature: Reference temperature (in °C)
         """
-        if reference_temperature not in temperature_levels:
-            temperature_levels = temperature_levels + [reference_temperature]
+        # The reference is always a level, duplicate levels are merged
+        levels = set(temperature_levels)
+        levels.add(reference_temperature)
         super().__init__(
-            levels=sorted(temperature_levels),
+            levels=tuple(sorted(levels)),
             reference=reference_temperature,
         )
 
-        self._reference_index = self._levels.index(reference_temperature)
+        self._reference_index = bisect_left(self._levels, reference_temperature)
+
+        # Levels are fixed after construction, so the slices are computed once
+        self._levels_above_reference = self._levels[self._reference_index + 1 :]
+        self._levels_below_reference = self._levels[: self._reference_index]
+        self._input_levels = self._levels[1:]
+        # Constant time membership tests for levels
+        self._levels_set = frozenset(self._levels)
 
         # Properties for solph interfaces
         self.outputs = {}
         self.inputs = {}
 
+    def get_surrounding_levels(self, level):
+        """Get the next bigger and smaller level."""
+        if level in self._levels_set:
+            return level, level
+
+        return super().get_surrounding_levels(level)
+
     @property
     def reference_level(self):
         """Return index or key of reference level"""
         return self._reference_index
 
+    @property
+    def levels_set(self):
+        """Return the temperature levels as a set for membership tests."""
+        return self._levels_set
+
     @property
     def levels_above_reference(self):
-        return self.levels[self._reference_index+1:]
+        return self._levels_above_reference
 
     @property
     def levels_below_reference(self):
-        return self.levels[:self._reference_index]
+        return self._levels_below_reference
 
     @property
     def input_levels(self):
-        """Return the list of input temperature levels."""
-        return self.levels[1:]
+        """Return the input temperature levels."""
+        return self._input_levels
 
     @property
     def output_levels(self):
-        """Return the list of output temperature levels."""
-        return self.levels
-
-    def _create_temperature_riser(self, temp_low, temp_high):
-            bus_in_pri = self.inputs[temp_high]
-            if temp_low > self.reference:
-                ratio = (temp_low - self.reference) / (temp_high - self.reference)
-                bus_out = self.outputs[temp_high]
-                bus_in_sec = self.outputs[temp_low]
+        """Return the output temperature levels."""
+        return self._levels
+
+    @classmethod
+    def _prepare_plan(cls, levels, reference):
+        """
+        Return the bus labels and temperature risers for the given levels.
+
+        Bus labels are given as tuples of (input label, output label) per
+        level. Risers are given as tuples of (label, index of the primary input,
+        index of the secondary input, index of the output, ratio), where the
+        indices refer to the sorted levels.
+
+        :param levels: Sorted tuple of temperature levels including the
+            reference
+        :param reference: Reference temperature
+        """
+        key = (levels, reference)
+        if key in cls._plan_cache:
+            return cls._plan_cache[key]
+
+        reference_index = bisect_left(levels, reference)
+        level_names = tuple(map("{:.0f}".format, levels))
+        # Labels are interned as the same levels are used by many carriers
+        bus_labels = tuple(
+            (sys.intern(f"in_{name}"), sys.intern(f"out_{name}"))
+            for name in level_names
+        )
+
+        ratios = _riser_ratios(levels, reference, reference_index).tolist()
+
+        risers = []
+        for i, ratio in enumerate(ratios):
+            if reference_index - 1 <= i <= reference_index:
+                # Levels next to the reference are connected directly
+                continue
+
+            if i > reference_index:
+                i_out, i_in_sec = i + 1, i
             else:
-                ratio = (temp_high - self.reference) / (temp_low - self.reference)
-                bus_out = self.outputs[temp_low]
-                bus_in_sec = self.outputs[temp_high]
+                i_out, i_in_sec = i, i + 1
+
+            risers.append(
+                (
+                    f"rise_{level_names[i]}_{level_names[i + 1]}",
+                    i + 1,
+                    i_in_sec,
+                    i_out,
+                    ratio,
+                )
+            )
 
-            # Temperature riser
-            self.create_solph_node(
-                label=f"rise_{temp_low:.0f}_{temp_high:.0f}",
+        plan = cls._plan_cache[key] = (bus_labels, tuple(risers))
+        return plan
+
+    def build_core(self):
+        """Build core structure of oemof.solph representation."""
+        create_solph_node = self.create_solph_node
+        bus_labels, risers = self._prepare_plan(self._levels, self.reference)
+
+        n_levels = len(self._levels)
+
+        # Thermal layers, created from the hottest level downwards
+        layer_buses = self.create_solph_nodes(
+            (label, Bus, {})
+            for in_out_labels in reversed(bus_labels)
+            for label in in_out_labels
+        )
+        # Input and output buses alternate, the coldest output bus is last
+        in_buses = layer_buses[-2::-2]
+        out_buses = layer_buses[::-2]
+
+        self.inputs = dict(zip(self._levels, in_buses))
+        self.outputs = dict(zip(self._levels, out_buses))
+
+        if n_levels == 1:
+            # Only the reference level, there is nothing to connect
+            return
+
+        # Heat at the input layers can cascade down to the next lower layer
+        edges = [(in_buses[i + 1], in_buses[i]) for i in range(n_levels - 1)]
+        for origin, target in edges:
+            origin.outputs[target] = Flow()
+
+        # add direct flows for the levels close to reference
+        reference_index = self._reference_index
+        if reference_index < n_levels - 1:
+            out_buses[reference_index + 1].inputs[
+                in_buses[reference_index + 1]
+            ] = Flow()
+
+        if reference_index > 0:
+            in_buses[reference_index].outputs[
+                out_buses[reference_index - 1]
+            ] = Flow()
+
+        # Temperature risers between adjacent levels
+        for label, i_in_pri, i_in_sec, i_out, ratio in risers:
+            bus_in_pri = in_buses[i_in_pri]
+            bus_in_sec = out_buses[i_in_sec]
+            bus_out = out_buses[i_out]
+
+            create_solph_node(
+                label=label,
                 node_type=Converter,
                 inputs={
                     bus_in_pri: Flow(),
@@ -149,53 +283,3 @@ class Heat(AbstractLayeredCarrier, AbstractSolphRepresentation):
                     bus_out: 1,
                 },
             )
-
-    def build_core(self):
-        """Build core structure of oemof.solph representation."""
-        bus_in = None
-        bus_out = None
-        bus_in_inputs = {}
-
-        # Thermal layers
-        for temperature in reversed(self._levels):
-            bus_in = self.create_solph_node(
-                label=f"in_{temperature:.0f}",
-                node_type=Bus,
-                inputs=bus_in_inputs,
-            )
-
-            self.inputs[temperature] = bus_in
-            bus_in_inputs = {bus_in: Flow()}
-
-            bus_out = self.create_solph_node(
-                label=f"out_{temperature:.0f}",
-                node_type=Bus,
-            )
-
-            self.outputs[temperature] = bus_out
-        
-        # add direct flows for the levels close to reference
-        if self.reference < self._levels[-1]:
-            temperature_above_reference = self._levels[self.reference_level+1]
-            self.outputs[temperature_above_reference].inputs[
-                self.inputs[temperature_above_reference]
-            ] = Flow()
-        
-        if self.reference > self._levels[0]:
-            self.inputs[self.reference].outputs[
-                self.outputs[self._levels[self.reference_level-1]]
-            ] = Flow()
-
-        # rise above reference temperature
-        for temp_low, temp_high in zip(
-            self._levels[self.reference_level+1:],
-            self._levels[self.reference_level+2:]
-        ):
-            self._create_temperature_riser(temp_low, temp_high)
-
-        # rise below reference temperature
-        for temp_low, temp_high in zip(
-            self._levels[0:self.reference_level],
-            self._levels[1:self.reference_level]
-        ):
-            self._create_temperature_riser(temp_low, temp_high)
\ No newline at end of file
@@ -1,11 +1,8 @@
 """Electricity energy demand."""
 
 
-from oemof.solph import Bus, Flow
-from oemof.solph.components import Sink
-
 from .._abstract_component import AbstractSolphRepresentation
-from .._data_handler import TimeseriesSpecifier, TimeseriesType
+from .._data_handler import TimeseriesSpecifier, normalize_timeseries_specifier
 from ..carriers import Electricity as ElectricityCarrier
 from ._abstract_demand import AbstractDemand
 
@@ -35,28 +32,14 @@ class Electricity(AbstractDemand, AbstractSolphRepresentation):
     def __init__(self, name: str, time_series: TimeseriesSpecifier):
         """Initialize electricity energy carrier and add components."""
         super().__init__(name=name)
-        self._time_series = time_series
-        self.input = None
+        self._time_series = normalize_timeseries_specifier(time_series)
 
     def build_core(self):
         """Build core structure of oemof.solph representation."""
         electricity_carrier = self.location.get_carrier(ElectricityCarrier)
 
-        bus = self.create_solph_node(
-            label="input",
-            node_type=Bus,
-            inputs={electricity_carrier.distribution: Flow()},
-        )
-
-        self.create_solph_node(
-            label="sink",
-            node_type=Sink,
-            inputs={
-                bus: Flow(
-                    nominal_value=1,
-                    fix=self._solph_model.data.get_timeseries(self._time_series, kind=TimeseriesType.INTERVAL),
-                )
-            },
+        self._create_sink_with_bus(
+            electricity_carrier.distribution, self._time_series
         )
 
         # TODO: categorize out flow
@@ -1,15 +1,20 @@
 """Room heating technologies."""
 
 
-from oemof.solph import Bus, Flow
-from oemof.solph.components import Sink, Converter
+from oemof.solph import Flow
+from oemof.solph.components import Converter
 
 from .._abstract_component import AbstractSolphRepresentation
-from .._data_handler import TimeseriesType
+from .._data_handler import TimeseriesSpecifier, normalize_timeseries_specifier
 from ..carriers import Heat
 from ._abstract_demand import AbstractDemand
 
 
+def _sign(value: float) -> int:
+    """Return the sign of the value as -1, 0 or 1."""
+    return (value > 0) - (value < 0)
+
+
 class FixedTemperatureHeat(AbstractDemand, AbstractSolphRepresentation):
     """
     Space heating with a fixed flow and return temperature.
@@ -43,7 +48,11 @@ class FixedTemperatureHeat(AbstractDemand, AbstractSolphRepresentation):
     """
 
     def __init__(
-        self, name: str, flow_temperature: float, return_temperature: float, time_series
+        self,
+        name: str,
+        flow_temperature: float,
+        return_temperature: float,
+        time_series: TimeseriesSpecifier,
     ):
         """
         Initialize space heater.
@@ -59,65 +68,76 @@ class FixedTemperatureHeat(AbstractDemand, AbstractSolphRepresentation):
         self.flow_temperature = flow_temperature
         self.return_temperature = return_temperature
 
-        self._time_series = time_series
+        self._time_series = normalize_timeseries_specifier(time_series)
 
     def build_core(self):
         """Build core structure of oemof.solph representation."""
         carrier = self.location.get_carrier(Heat)
+        flow_temperature = self.flow_temperature
+        return_temperature = self.return_temperature
+        reference = carrier.reference
 
-        if self.flow_temperature not in carrier.levels:
+        levels = carrier.levels_set
+        if flow_temperature not in levels:
             raise ValueError("Flow temperature must be a temperature level")
 
-        if self.return_temperature not in carrier.levels:
+        if return_temperature not in levels:
             raise ValueError("Return must be a temperature level")
 
+        flow_bus = carrier.outputs[flow_temperature]
+        return_bus = carrier.outputs[return_temperature]
+
+        if return_temperature == reference:
+            # Nothing is returned, so the heat is taken from the flow level
+            # without a heat exchanger
+            self._create_sink_with_bus(flow_bus, self._time_series, "output")
+        elif flow_temperature == reference:
+            # Nothing is taken from the flow level, the heat exchanger would
+            # only forward energy from the return level
+            self._create_sink_with_bus(return_bus, self._time_series, "output")
+        else:
+            output = self._create_sink_with_bus(None, self._time_series, "output")
+            self._create_heat_exchanger(output, flow_bus, return_bus, reference)
+
+    def _create_heat_exchanger(self, output, flow_bus, return_bus, reference):
+        """
+        Connect the output to the flow and return level of the carrier.
 
-        output = self.create_solph_node(
-            label="output",
-            node_type=Bus,
-        )
-        temperature_ratio = 0
-        inputs = {}
-        outputs= {output: Flow()}
-        conversion_factors = {}
-
-        if self.flow_temperature > carrier.reference:
-            inputs[carrier.outputs[self.flow_temperature]] = Flow()
-        elif self.flow_temperature < carrier.reference:
-            outputs[carrier.outputs[self.flow_temperature]] = Flow()
-
-        if self.return_temperature > carrier.reference:
-            outputs[carrier.outputs[self.return_temperature]] = Flow()
-        elif self.return_temperature < carrier.reference:
-            inputs[carrier.outputs[self.return_temperature]] = Flow()
-
-        if self.return_temperature > carrier.reference:
-            temperature_ratio = (
-                self.return_temperature - carrier.reference
-            ) / (self.flow_temperature - carrier.reference)
-            conversion_factors = {
-                carrier.outputs[self.flow_temperature]: 1,
-                output: 1 - temperature_ratio,
-                carrier.outputs[self.return_temperature]: temperature_ratio,
-            }
-        elif self.return_temperature < carrier.reference:
-            if self.flow_temperature < carrier.reference:
-                temperature_ratio = (
-                    self.flow_temperature - carrier.reference
-                ) / (self.return_temperature - carrier.reference)
+        Neither the flow nor the return temperature may equal the reference.
+        """
+        # Temperature differences to the reference, used for the ratios
+        flow_delta = self.flow_temperature - reference
+        return_delta = self.return_temperature - reference
+
+        # Inputs, outputs and conversion factors depend on the side of the
+        # reference the flow and the return temperature are on
+        match _sign(flow_delta), _sign(return_delta):
+            case 1, 1:
+                temperature_ratio = return_delta / flow_delta
+                inputs = {flow_bus: Flow()}
+                outputs = {output: Flow(), return_bus: Flow()}
                 conversion_factors = {
-                    carrier.outputs[self.flow_temperature]: 1 - temperature_ratio,
+                    flow_bus: 1,
+                    output: 1 - temperature_ratio,
+                    return_bus: temperature_ratio,
+                }
+            case -1, -1:
+                temperature_ratio = flow_delta / return_delta
+                inputs = {return_bus: Flow()}
+                outputs = {output: Flow(), flow_bus: Flow()}
+                conversion_factors = {
+                    flow_bus: 1 - temperature_ratio,
                     output: temperature_ratio,
-                    carrier.outputs[self.return_temperature]: 1,
+                    return_bus: 1,
                 }
-            elif self.flow_temperature > carrier.reference:
-                temperature_ratio = (
-                    self.flow_temperature - carrier.reference
-                ) / (self.flow_temperature - self.return_temperature)
+            case 1, -1:
+                temperature_ratio = flow_delta / (flow_delta - return_delta)
+                inputs = {flow_bus: Flow(), return_bus: Flow()}
+                outputs = {output: Flow()}
                 conversion_factors = {
-                    carrier.outputs[self.flow_temperature]: temperature_ratio,
+                    flow_bus: temperature_ratio,
                     output: 1,
-                    carrier.outputs[self.return_temperature]: 1 - temperature_ratio,
+                    return_bus: 1 - temperature_ratio,
                 }
 
         self.create_solph_node(
@@ -127,14 +147,3 @@ class FixedTemperatureHeat(AbstractDemand, AbstractSolphRepresentation):
             outputs=outputs,
             conversion_factors=conversion_factors,
         )
-
-        self.create_solph_node(
-            label="sink",
-            node_type=Sink,
-            inputs={
-                output: Flow(
-                    nominal_value=1,
-                    fix=self._solph_model.data.get_timeseries(self._time_series, kind=TimeseriesType.INTERVAL),
-                )
-            },
-        )
@@ -1,8 +1,6 @@
 """Gas demand."""
 
-from oemof.solph import Bus, Flow
-from oemof.solph.components import Sink
-from .._data_handler import TimeseriesSpecifier, TimeseriesType
+from .._data_handler import TimeseriesSpecifier, normalize_timeseries_specifier
 from .._abstract_component import AbstractSolphRepresentation
 from ..carriers import GasCarrier
 from ..physics import Gas
@@ -36,7 +34,7 @@ class GasDemand(AbstractDemand, AbstractSolphRepresentation):
         """Initialize gas demand."""
         super().__init__(name=name)
 
-        self._time_series = time_series
+        self._time_series = normalize_timeseries_specifier(time_series)
         self.gas_type = gas_type
         self.pressure = pressure
 
@@ -45,19 +43,6 @@ class GasDemand(AbstractDemand, AbstractSolphRepresentation):
         gas_carrier = self.location.get_carrier(GasCarrier)
         _, pressure = gas_carrier.get_surrounding_levels(self.gas_type, self.pressure)
 
-        gas_bus = self.create_solph_node(
-            label="input",
-            node_type=Bus,
-            inputs={gas_carrier.outputs[self.gas_type][pressure]: Flow()},
-        )
-
-        self.create_solph_node(
-            label="sink",
-            node_type=Sink,
-            inputs={
-                gas_bus: Flow(
-                    nominal_value=1,
-                    fix=self._solph_model.data.get_timeseries(self._time_series, kind=TimeseriesType.INTERVAL),
-                )
-            },
+        self._create_sink_with_bus(
+            gas_carrier.outputs[self.gas_type][pressure], self._time_series
         )
@@ -19,7 +19,7 @@ class HeatSink(AbstractDemand, AbstractSolphRepresentation):
     def __init__(
         self,
         name: str,
-        temperature_levels: float = None,
+        temperature_levels: float,
     ):
         """
         Initialize Heat Sink.
@@ -39,7 +39,7 @@ class HeatSink(AbstractDemand, AbstractSolphRepresentation):
             self.temperature_levels
         )
 
-        if temperature_levels not in heat_carrier.output_levels:
+        if temperature_levels not in heat_carrier.levels_set:
             raise ValueError("Temperature must be a valid Temperature level")
 
         self.create_solph_node(
@@ -47,6 +47,7 @@ from ._gas_definition import (
     calc_biogas_heating_value,
     calc_biogas_molar_mass,
     calc_natural_gas_molar_mass,
+    get_gas,
 )
 
 __all__ = [
@@ -77,6 +78,7 @@ __all__ = [
     "NATURAL_GAS",
     "BIO_METHANE",
     "BIOGAS",
+    "get_gas",
     "mega_to_one",
     "one_to_mega"
 ]
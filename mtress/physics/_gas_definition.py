@@ -6,6 +6,8 @@ here.
 
 
 from dataclasses import dataclass
+from typing import Final
+
 from ._helper_functions import bar_to_pascal
 from ._constants import IDEAL_GAS_CONSTANT
 
@@ -108,7 +110,7 @@ def calc_natural_gas_molar_mass(
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Gas:
     """
     Here we provide the gas properties for some predefined
@@ -127,21 +129,21 @@ class Gas:
 
 # Object of different predefined gases
 
-HYDROGEN = Gas(
+HYDROGEN: Final[Gas] = Gas(
     name="Hydrogen",
     LHV=H2_LHV,
     HHV=H2_HHV,
     molar_mass=H2_MOLAR_MASS,
 )
 
-NATURAL_GAS = Gas(
+NATURAL_GAS: Final[Gas] = Gas(
     name="NaturalGas",
     LHV=NG_LHV,
     HHV=NG_HHV,
     molar_mass=calc_natural_gas_molar_mass(),
 )
 
-BIOGAS = Gas(
+BIOGAS: Final[Gas] = Gas(
     name="Biogas",
     LHV=calc_biogas_heating_value(),
     HHV=calc_biogas_heating_value(),
@@ -154,9 +156,28 @@ BIOGAS = Gas(
 # and the specific production process, and it may contain trace impurities
 # and other gases. To get a more precise value for a specific bio-methane
 # source, you would need to know its exact composition.
-BIO_METHANE = Gas(
+BIO_METHANE: Final[Gas] = Gas(
     name="BioMethane",
     LHV=CH4_LHV,
     HHV=CH4_HHV,
     molar_mass=CH4_MOLAR_MASS,
 )
+
+# Registry of the predefined gases, so that look-ups by name return the
+# very same object and identity comparisons can be used.
+_REGISTRY: dict[str, Gas] = {
+    gas.name: gas for gas in (HYDROGEN, NATURAL_GAS, BIOGAS, BIO_METHANE)
+}
+
+
+def get_gas(name: str) -> Gas:
+    """
+    Return the predefined gas with the given name.
+
+    :param name: Name of the gas, e.g. "Hydrogen" or "NaturalGas"
+    :return: The (singleton) Gas object
+    """
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise KeyError(f"No predefined gas named {name}") from None
@@ -13,7 +13,7 @@ from ..carriers import Electricity, Heat, GasCarrier
 from ..physics import Gas, HYDROGEN, NATURAL_GAS, BIOGAS, BIO_METHANE
 from ._abstract_technology import AbstractTechnology
 
-LOGGER = logging.getLogger(__file__)
+LOGGER = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
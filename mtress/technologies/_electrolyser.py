@@ -14,7 +14,7 @@ from ..carriers import Electricity, GasCarrier, Heat
 from ..physics import HYDROGEN
 from ._abstract_technology import AbstractTechnology
 
-LOGGER = logging.getLogger(__file__)
+LOGGER = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -13,7 +13,7 @@ from ..carriers import Electricity, Heat, GasCarrier
 from ..physics import HYDROGEN, Gas
 from ._abstract_technology import AbstractTechnology
 
-LOGGER = logging.getLogger(__file__)
+LOGGER = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -8,7 +8,7 @@ from .._abstract_component import AbstractSolphRepresentation
 from ..carriers import Electricity, Heat
 from ._abstract_technology import AbstractTechnology
 
-LOGGER = logging.getLogger(__file__)
+LOGGER = logging.getLogger(__name__)
 
 
 class HeatingRod(AbstractTechnology, AbstractSolphRepresentation):
@@ -54,7 +54,7 @@ class HeatingRod(AbstractTechnology, AbstractSolphRepresentation):
 
         _, temp_level = heat_carrier.get_surrounding_levels(self.thermal_temperature)
 
-        if temp_level not in heat_carrier.levels:
+        if temp_level not in heat_carrier.levels_set:
             raise ValueError("No suitable temperature level available")
 
         heat_bus = heat_carrier.inputs[temp_level]
@@ -6,7 +6,7 @@ from mtress.carriers import GasCarrier
 from mtress.physics import Gas
 from mtress._abstract_component import AbstractSolphRepresentation
 
-LOGGER = logging.getLogger(__file__)
+LOGGER = logging.getLogger(__name__)
 
 
 class GasGridConnection(AbstractSolphRepresentation):
@@ -44,6 +44,10 @@ def test_layered_heat_demand():
         },
     )
 
+    # Demands returning at the reference temperature need no heat exchanger
+    demand_20_10 = next(c for c in house_1.components if c.name == "20_10")
+    assert [n.short_label for n in demand_20_10.solph_nodes] == ["output", "sink"]
+
     in_80 = list(solph_model.energy_system.nodes)[0]
     heat_source = solph.components.Source(
             label="heat_source",
@@ -65,6 +69,38 @@ def test_layered_heat_demand():
 
     return solph_model
 
+
+def test_heat_demand_with_flow_at_reference():
+    house_1 = Location(name="house_1")
+    house_1.add(
+        carriers.Heat(
+            temperature_levels=[0, 10, 20],
+            reference_temperature=10,
+        )
+    )
+    demand = HeatDemand(
+        name="10_0",
+        flow_temperature=10,
+        return_temperature=0,
+        time_series=[1, 1, 1, 1],
+    )
+    house_1.add(demand)
+
+    SolphModel(
+        meta_model=MetaModel(locations=[house_1]),
+        timeindex={
+            "start": "2021-07-10 00:00:00",
+            "end": "2021-07-10 01:00:00",
+            "freq": "15T",
+        },
+    )
+
+    # The output takes the heat directly from the return level
+    output, _ = demand.solph_nodes
+    assert output.short_label == "output"
+    assert [node.short_label for node in output.inputs] == ["out_0"]
+
+
 if __name__ == "__main__":
     os.chdir(os.path.dirname (__file__))
 
@@ -24,7 +24,10 @@ def test_gas_carrier_levels():
     assert gas_carier.levels[HYDROGEN] == hydrogen_pressures
 
     assert gas_carier.get_surrounding_levels(HYDROGEN, 3) == (3, 3)
-    assert gas_carier.get_surrounding_levels(HYDROGEN, 4) == (3, 5)
+    surrounding_levels = gas_carier.get_surrounding_levels(HYDROGEN, 4)
+    assert surrounding_levels == (3, 5)
+    # repeated lookups are served from the cache
+    assert gas_carier.get_surrounding_levels(HYDROGEN, 4) is surrounding_levels
     with pytest.raises(TypeError):
         # gas needs to be specified
         gas_carier.get_surrounding_levels(4)
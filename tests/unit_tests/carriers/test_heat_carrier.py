@@ -3,8 +3,11 @@
 Tests for the MTRESS heat carrier.
 """
 
+import math
+
 import pytest
 
+from mtress import Location, MetaModel, SolphModel
 from mtress.carriers import Heat as HeatCarrier
 
 
@@ -20,17 +23,21 @@ def test_heat_carrier_with_reference():
         temperature_levels=temperatures,
         reference_temperature=ref_temperature,
     )
-    assert heat_carier.levels == sorted(temperatures)
+    assert heat_carier.levels == tuple(sorted(temperatures))
 
     assert heat_carier.get_surrounding_levels(15) == (15, 15)
-    assert heat_carier.get_surrounding_levels(20) == (15, 35)
+    surrounding_levels = heat_carier.get_surrounding_levels(20)
+    assert surrounding_levels == (15, 35)
+    # repeated lookups are served from the cache
+    assert heat_carier.get_surrounding_levels(20) is surrounding_levels
     
     reference_level = heat_carier.reference_level
     assert reference_level == 2  # [-10, 10, *15*, ...]
     assert heat_carier.levels[reference_level] == ref_temperature
 
-    assert heat_carier.levels_above_reference == [35, 80]
-    assert heat_carier.levels_below_reference == [-10, 10]
+    assert heat_carier.levels_set == frozenset(temperatures)
+    assert heat_carier.levels_above_reference == (35, 80)
+    assert heat_carier.levels_below_reference == (-10, 10)
     
 def test_heat_carrier_without_reference():
     # reference temperature (default: 0) is added to the levels
@@ -38,15 +45,17 @@ def test_heat_carrier_without_reference():
     heat_carier = HeatCarrier(
         temperature_levels=temperatures,
     )
-    assert heat_carier.levels == sorted(temperatures + [0])
+    assert heat_carier.levels == tuple(sorted(temperatures + [0]))
 
     assert heat_carier.get_surrounding_levels(0) == (0, 0)
     assert heat_carier.get_surrounding_levels(-5) == (-10, 0)
+    assert heat_carier.get_surrounding_levels(-20) == (-math.inf, -10)
+    assert heat_carier.get_surrounding_levels(90) == (80, math.inf)
 
     assert heat_carier.reference_level == 1  # [-10, *0*, ...]
 
-    assert heat_carier.levels_above_reference == [15, 35, 80]
-    assert heat_carier.levels_below_reference == [-10]
+    assert heat_carier.levels_above_reference == (15, 35, 80)
+    assert heat_carier.levels_below_reference == (-10,)
 
 
 def test_heat_carrier_without_low_temperatures():
@@ -55,8 +64,8 @@ def test_heat_carrier_without_low_temperatures():
         temperature_levels=temperatures,
         reference_temperature=15,
     )
-    assert heat_carier.levels_above_reference == temperatures
-    assert heat_carier.levels_below_reference == []
+    assert heat_carier.levels_above_reference == tuple(temperatures)
+    assert heat_carier.levels_below_reference == ()
 
 
 def test_heat_carrier_without_high_temperatures():
@@ -65,6 +74,63 @@ def test_heat_carrier_without_high_temperatures():
         temperature_levels=temperatures,
         reference_temperature=15,
     )
-    assert heat_carier.levels_above_reference == []
-    assert heat_carier.levels_below_reference == temperatures
+    assert heat_carier.levels_above_reference == ()
+    assert heat_carier.levels_below_reference == tuple(temperatures)
+
+
+def test_heat_carrier_with_duplicate_levels():
+    heat_carier = HeatCarrier(
+        temperature_levels=[35, 80, 35, 15],
+        reference_temperature=15,
+    )
+    assert heat_carier.levels == (15, 35, 80)
+    assert heat_carier.reference_level == 0
+
+
+def test_heat_carrier_plan_is_shared():
+    heat_carier_1 = HeatCarrier(temperature_levels=[-10, 35, 80], reference_temperature=15)
+    heat_carier_2 = HeatCarrier(temperature_levels=[80, 35, -10], reference_temperature=15)
+
+    plan = HeatCarrier._prepare_plan(heat_carier_1.levels, heat_carier_1.reference)
+    assert plan is HeatCarrier._prepare_plan(heat_carier_2.levels, heat_carier_2.reference)
+
+    bus_labels, risers = plan
+    assert [labels[0] for labels in bus_labels] == ["in_-10", "in_15", "in_35", "in_80"]
+    assert bus_labels[-1][1] == "out_80"
+    assert [riser[0] for riser in risers] == ["rise_35_80"]
+
+
+def test_heat_carrier_flows_are_not_shared():
+    house_1 = Location(name="house_1")
+    house_1.add(
+        HeatCarrier(temperature_levels=[-10, 10, 35, 80], reference_temperature=15)
+    )
+    solph_model = SolphModel(
+        meta_model=MetaModel(locations=[house_1]),
+        timeindex={
+            "start": "2021-07-10 00:00:00",
+            "end": "2021-07-10 01:00:00",
+            "freq": "15T",
+        },
+    )
+
+    # solph flows are edges and thus must be unique per connection
+    flows = solph_model.energy_system.flows()
+    assert len({id(flow) for flow in flows.values()}) == len(flows)
+
+
+def test_heat_carrier_with_single_level():
+    house_1 = Location(name="house_1")
+    heat_carier = HeatCarrier(temperature_levels=[20], reference_temperature=20)
+    house_1.add(heat_carier)
+    solph_model = SolphModel(
+        meta_model=MetaModel(locations=[house_1]),
+        timeindex={
+            "start": "2021-07-10 00:00:00",
+            "end": "2021-07-10 01:00:00",
+            "freq": "15T",
+        },
+    )
 
+    assert len(solph_model.energy_system.nodes) == 2
+    assert list(heat_carier.inputs) == list(heat_carier.outputs) == [20]
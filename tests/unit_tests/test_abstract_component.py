@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the abstract MTRESS components.
+"""
+
+import pytest
+from oemof.solph import Bus
+
+from mtress import carriers, Location, MetaModel, SolphModel
+
+
+def test_duplicate_solph_node_label():
+    house_1 = Location(name="house_1")
+    electricity = carriers.Electricity()
+    house_1.add(electricity)
+
+    SolphModel(
+        meta_model=MetaModel(locations=[house_1]),
+        timeindex={
+            "start": "2021-07-10 00:00:00",
+            "end": "2021-07-10 01:00:00",
+            "freq": "15T",
+        },
+    )
+
+    with pytest.raises(KeyError, match="already exists"):
+        electricity.create_solph_node(label="distribution", node_type=Bus)
+
+
+def test_create_solph_nodes():
+    house_1 = Location(name="house_1")
+    electricity = carriers.Electricity()
+    house_1.add(electricity)
+
+    solph_model = SolphModel(
+        meta_model=MetaModel(locations=[house_1]),
+        timeindex={
+            "start": "2021-07-10 00:00:00",
+            "end": "2021-07-10 01:00:00",
+            "freq": "15T",
+        },
+    )
+
+    bus_a, bus_b = electricity.create_solph_nodes(
+        [("bus_a", Bus, {}), ("bus_b", Bus, {"balanced": False})]
+    )
+    assert bus_a.short_label == "bus_a"
+    assert not bus_b.balanced
+    assert electricity.solph_nodes[-2:] == [bus_a, bus_b]
+    assert bus_b in solph_model.energy_system.nodes
+
+    with pytest.raises(KeyError, match="already exists"):
+        electricity.create_solph_nodes([("bus_c", Bus, {}), ("bus_c", Bus, {})])
+
+    with pytest.raises(KeyError, match="already exists"):
+        electricity.create_solph_nodes([("bus_d", Bus, {}), ("bus_a", Bus, {})])
+
+    # Nothing is left behind by a failed batch
+    assert electricity.solph_nodes[-2:] == [bus_a, bus_b]
+    electricity.create_solph_nodes([("bus_c", Bus, {}), ("bus_d", Bus, {})])
+
+
+def test_collect_solph_nodes():
+    house_1 = Location(name="house_1")
+    electricity = carriers.Electricity()
+    house_1.add(electricity)
+
+    solph_model = SolphModel(
+        meta_model=MetaModel(locations=[house_1]),
+        timeindex={
+            "start": "2021-07-10 00:00:00",
+            "end": "2021-07-10 01:00:00",
+            "freq": "15T",
+        },
+    )
+
+    with electricity.collect_solph_nodes():
+        bus = electricity.create_solph_node(label="bus_a", node_type=Bus)
+        assert bus not in solph_model.energy_system.nodes
+
+    assert bus in solph_model.energy_system.nodes
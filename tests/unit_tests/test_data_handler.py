@@ -3,11 +3,13 @@
 Tests for the MTRESS data handler.
 """
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from mtress._data_handler import DataHandler
 from mtress._data_handler import TimeseriesType
+from mtress._data_handler import normalize_timeseries_specifier
 
 
 @pytest.fixture
@@ -34,6 +36,48 @@ class TestDataHandler:
 
         assert (data == data_list).all()
 
+    def test_normalized_specifier(self, data_handler):
+        values = normalize_timeseries_specifier((1, 2, 3, 4))
+        assert values.dtype == np.float64
+        assert normalize_timeseries_specifier("FILE:data.csv:x") == "FILE:data.csv:x"
+        assert normalize_timeseries_specifier(values) is values
+
+        with pytest.raises(ValueError, match="one-dimensional"):
+            normalize_timeseries_specifier([[1, 2], [3, 4]])
+
+        data = data_handler.get_timeseries(values, kind=TimeseriesType.INTERVAL)
+        assert (data == [1, 2, 3, 4]).all()
+
+    def test_shared_array_is_cached(self, data_handler):
+        values = np.array([1.0, 2.0, 3.0, 4.0])
+        data = data_handler.get_timeseries(values, kind=TimeseriesType.INTERVAL)
+
+        assert data_handler.get_timeseries(values, kind=TimeseriesType.INTERVAL) is data
+        assert (
+            data_handler.get_timeseries(values.copy(), kind=TimeseriesType.INTERVAL)
+            is not data
+        )
+
+    def test_interval_timeseries(self, data_handler):
+        data = data_handler.get_interval_timeseries([1, 2, 3, 4])
+
+        assert (data == [1, 2, 3, 4]).all()
+        assert data.index.equals(data_handler.timeindex[:-1])
+
+    def test_constant_is_cached(self, data_handler):
+        point_data = data_handler.get_timeseries(3, kind=TimeseriesType.POINT)
+        interval_data = data_handler.get_timeseries(3, kind=TimeseriesType.INTERVAL)
+
+        assert len(point_data) == 5
+        assert len(interval_data) == 4
+        assert data_handler.get_timeseries(3, kind=TimeseriesType.POINT) is point_data
+
+        data_handler.invalidate()
+        assert (
+            data_handler.get_timeseries(3, kind=TimeseriesType.POINT)
+            is not point_data
+        )
+
     def test_series(self, data_handler):
         data_list = [1, 2, 3, 4, 5]
         data_series = pd.Series(data=data_list)
@@ -73,6 +117,13 @@ class TestDataHandler:
 
         assert (point_data == data_list).all()
         assert (interval_data == data_list[:-1]).all()
+        # matching series are used without copying
+        assert point_data is data_series
+        # resolved series are cached
+        assert (
+            data_handler.get_timeseries(data_series, kind=TimeseriesType.INTERVAL)
+            is interval_data
+        )
 
         longer_date_range = pd.date_range(
             start=date_range[0] - 2 * date_range.freq,
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the MTRESS gas definitions.
+"""
+
+import pytest
+
+from mtress.physics import BIOGAS, HYDROGEN, NATURAL_GAS, get_gas
+
+
+def test_get_gas():
+    assert get_gas("Hydrogen") is HYDROGEN
+    assert get_gas("NaturalGas") is NATURAL_GAS
+    assert get_gas("Biogas") is BIOGAS
+
+    with pytest.raises(KeyError):
+        get_gas("Helium")